@@ -2,9 +2,9 @@ import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
-from webos_pointer_bridge import WebOSPointerBridge
+from webos_pointer_bridge import WebOSPointerBridge, run_event_loop
 
 
 DEFAULT_TV_PORT = 3001
@@ -73,10 +73,22 @@ async def run_bridge(tv_cfg: Dict[str, Any]) -> None:
         origin=tv_cfg["origin"] or None,
     )
 
+    logging.info("Starting bridge for %s (ws://0.0.0.0:%s -> %s)", name, tv_cfg["listen_port"], tv_cfg["host"])
+    await retry_until_done(name, bridge.connect_backend)
+
+    # Pointer drops are repaired in the background; only the LAN side is restarted here.
+    watcher = asyncio.create_task(bridge.watch_pointer())
+    try:
+        await retry_until_done(name, bridge.serve_clients)
+    finally:
+        watcher.cancel()
+
+
+async def retry_until_done(name: str, step: Callable[[], Awaitable[None]]) -> None:
     while True:
         try:
-            logging.info("Starting bridge for %s (ws://0.0.0.0:%s -> %s)", name, tv_cfg["listen_port"], tv_cfg["host"])
-            await bridge.start()
+            await step()
+            return
         except asyncio.CancelledError:
             raise
         except (TimeoutError, OSError) as err:
@@ -87,10 +99,9 @@ async def run_bridge(tv_cfg: Dict[str, Any]) -> None:
                 err,
                 RETRY_DELAY_SECONDS,
             )
-            await asyncio.sleep(RETRY_DELAY_SECONDS)
         except Exception:
             logging.exception("Bridge for %s crashed; retrying in %ss", name, RETRY_DELAY_SECONDS)
-            await asyncio.sleep(RETRY_DELAY_SECONDS)
+        await asyncio.sleep(RETRY_DELAY_SECONDS)
 
 
 async def main() -> None:
@@ -121,4 +132,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -0,0 +1,86 @@
+"""
+Regression test: a slow TV must get folded moves, not a replay of every client packet.
+
+Run: python -m unittest discover -s addon/webos-pointer-bridge/tests
+"""
+
+import asyncio
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    import webos_pointer_bridge as bridge_module
+    from websockets.protocol import State
+except ImportError as err:  # pragma: no cover - needs the add-on's requirements
+    raise unittest.SkipTest(f"webos_pointer_bridge dependencies missing: {err}") from err
+
+TV_SEND_SECONDS = 0.05
+CLIENT_MOVES = 300
+
+
+class SlowTV:
+    """Pointer socket stub whose send takes TV_SEND_SECONDS per frame."""
+
+    state = State.OPEN
+
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+
+    async def send(self, message: bytes, text: bool = False) -> None:
+        await asyncio.sleep(TV_SEND_SECONDS)
+        self.frames.append(message)
+
+    def records(self) -> list[dict[str, str]]:
+        records = []
+        for frame in self.frames:
+            for block in frame.decode().split("\n\n"):
+                if block:
+                    records.append(dict(line.split(":", 1) for line in block.split("\n")))
+        return records
+
+
+class FastClient:
+    """Client connection stub that streams small moves faster than the TV accepts them."""
+
+    remote_address = ("test", 0)
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    def __aiter__(self):
+        return self._messages()
+
+    async def _messages(self):
+        for _ in range(self.count):
+            await asyncio.sleep(0.001)
+            yield json.dumps({"t": "move", "dx": 1, "dy": 0})
+
+
+class PointerBackpressureTest(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_tv_gets_folded_moves(self) -> None:
+        bridge = bridge_module.WebOSPointerBridge("tv", 3000, False, "127.0.0.1", 0, Path("unused.json"), None)
+        bridge._tune_socket = lambda conn: None
+        tv = SlowTV()
+        bridge.pointer_ws = tv
+        bridge._start_pointer_writer()
+
+        await bridge._handle_client(FastClient(CLIENT_MOVES))
+        for _ in range(100):
+            if bridge._pointer_queue.empty() and sum(int(r["dx"]) for r in tv.records()) == CLIENT_MOVES:
+                break
+            await asyncio.sleep(TV_SEND_SECONDS)
+        bridge._pointer_writer.cancel()
+
+        records = tv.records()
+        self.assertEqual(sum(int(r["dx"]) for r in records), CLIENT_MOVES)
+        # Without backpressure every client move was replayed as its own record.
+        self.assertLess(len(records), CLIENT_MOVES // 5)
+        self.assertLessEqual(bridge._pointer_queue.qsize(), bridge_module.POINTER_QUEUE_LIMIT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,18 +18,43 @@ in webos_client_key.json next to this script.
 
 import argparse
 import asyncio
+import itertools
 import json
 import logging
-import math
+import socket
 import ssl
+from collections import deque
+from contextlib import suppress
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Callable, Coroutine, Optional
 
 import websockets
 from websockets.client import ClientConnection
 from websockets.exceptions import ConnectionClosed, InvalidMessage
+from websockets.protocol import State
 from websockets.server import ServerConnection
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type.
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj: object) -> bytes:
+    # Returns UTF-8 bytes; send them with text=True so webOS still receives a Text frame.
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 POINTER_URI = "ssap://com.webos.service.networkinput/getPointerInputSocket"
 IME_URI = "ssap://com.webos.service.ime/registerRemoteKeyboard"
 LAUNCH_URI = "ssap://system.launcher/launch"
@@ -41,7 +66,43 @@ APP_LIST_URIS = (
 # webOS pointer socket becomes non-linear with large deltas; keep packets small.
 MAX_POINTER_DELTA = 40
 MAX_POINTER_CHUNKS = 64
+POINTER_RETRY_MIN_SECONDS = 1
+POINTER_RETRY_MAX_SECONDS = 60
+# At most one frame waits while another is in flight; beyond that the client
+# dispatcher blocks, so its inbox fills and folds moves instead of queueing them here.
+POINTER_QUEUE_LIMIT = 1
 SCROLL_SCALE = 0.005
+# Scroll remainders are kept in fixed point (SCROLL_UNIT per webOS scroll step).
+SCROLL_UNIT = 1_000_000
+SCROLL_HALF_UNIT = SCROLL_UNIT // 2
+SCROLL_UNITS_PER_PX = round(SCROLL_SCALE * SCROLL_UNIT)
+# Typed characters arriving within this window are sent as one IME insertText.
+TEXT_BATCH_SECONDS = 0.015
+# Pre-encoded pointer records; %-formatting a (dx, dy) chunk tuple fills them in.
+MOVE_TEMPLATE = b"type:move\ndx:%d\ndy:%d\n\n"
+SCROLL_TEMPLATE = b"type:scroll\ndx:%d\ndy:%d\n\n"
+KEY_MAP = {
+    "enter": "ENTER",
+    "backspace": "BACKSPACE",
+    "escape": "BACK",
+    "back": "BACK",
+    "tab": "TAB",
+    "space": "SPACE",
+    "delete": "BACKSPACE",
+    "arrow_left": "LEFT",
+    "arrow_right": "RIGHT",
+    "arrow_up": "UP",
+    "arrow_down": "DOWN",
+    "home": "HOME",
+    "end": "END",
+    "page_up": "PAGEUP",
+    "page_down": "PAGEDOWN",
+    "power": "POWER",
+    "settings": "MENU",
+}
+VOL_MAP = {"up": "VOLUMEUP", "down": "VOLUMEDOWN", "mute": "MUTE"}
+CLICK_PAYLOAD = b"type:click\n\n"
+BUTTON_PAYLOADS = {name: f"type:button\nname:{name}\n\n".encode() for name in (*KEY_MAP.values(), *VOL_MAP.values())}
 
 
 class WebOSPointerBridge:
@@ -62,76 +123,193 @@ class WebOSPointerBridge:
         self.listen_port = listen_port
         self.client_key_file = client_key_file
         self.origin = origin
+        # The origin never changes after construction, so resolve both header variants once.
+        self._origin_hdr_default = self._origin_header(send_default=True)
+        self._origin_hdr_nondefault = self._origin_header(send_default=False)
 
         self.client_key: Optional[str] = None
         self.session_ws: Optional[ClientConnection] = None
         self.pointer_ws: Optional[ClientConnection] = None
+        self._pointer_queue: Optional[asyncio.Queue[bytes]] = None
+        self._pointer_writer: Optional[asyncio.Task] = None
         self.ime_ws: Optional[ClientConnection] = None
         self._ime_failed = False
         self._connect_lock = asyncio.Lock()
-        self._session_request_lock = asyncio.Lock()
-        self._scroll_rem_x = 0.0
-        self._scroll_rem_y = 0.0
+        self._pointer_connecting: Optional[asyncio.Event] = None
+        self._ime_connecting: Optional[asyncio.Event] = None
+        self._ime_task: Optional[asyncio.Task] = None
+        self._ssl_ctx: Optional[ssl.SSLContext] = None
+        self._pending_text: list[str] = []
+        self._text_lock = asyncio.Lock()
+        self._text_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._text_flush_task: Optional[asyncio.Task] = None
+        self._dispatch: dict[str, Callable[[ServerConnection, dict], Awaitable[None]]] = {
+            "move": self._on_move,
+            "scroll": self._on_scroll,
+            "click": self._on_click,
+            "double_click": self._on_double_click,
+            "text": self._on_text,
+            "key": self._on_key,
+            "volume": self._on_volume,
+            "query_apps": self._on_query_apps,
+            "list_apps": self._on_list_apps,
+            "launch_app": self._on_launch_app,
+        }
+        self._session_pending: dict[str, asyncio.Future] = {}
+        self._session_reader: Optional[asyncio.Task] = None
+        self._request_ids = itertools.count(1)
+        self._scroll_rem_x = 0
+        self._scroll_rem_y = 0
 
     async def start(self) -> None:
+        await self.connect_backend()
+        await self.serve_clients()
+
+    async def connect_backend(self) -> None:
         self._load_client_key()
         await self.ensure_pointer()
-        server = await websockets.serve(self._handle_client, self.listen_host, self.listen_port)
+
+    async def serve_clients(self) -> None:
+        # Card messages are tiny; permessage-deflate would cost more than it saves.
+        server = await websockets.serve(self._handle_client, self.listen_host, self.listen_port, compression=None)
         logging.info("Listening for touchpad clients on ws://%s:%s", self.listen_host, self.listen_port)
         async with server:
             await asyncio.Future()  # run forever
 
+    async def watch_pointer(self) -> None:
+        # Reconnect a dropped pointer socket in the background (with backoff) so a TV
+        # hiccup does not tear down the card-facing server.
+        delay = POINTER_RETRY_MIN_SECONDS
+        while True:
+            pointer_ws = self.pointer_ws
+            if pointer_ws and not self._is_closed(pointer_ws):
+                await pointer_ws.wait_closed()
+                continue
+            try:
+                await self.ensure_pointer()
+            except Exception as err:
+                log = logging.warning if delay == POINTER_RETRY_MIN_SECONDS else logging.debug
+                log("Pointer reconnect failed (%s: %s); retrying in %ss", type(err).__name__, err, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, POINTER_RETRY_MAX_SECONDS)
+            else:
+                delay = POINTER_RETRY_MIN_SECONDS
+
     async def _handle_client(self, ws: ServerConnection) -> None:
         logging.info("Client connected: %s", ws.remote_address)
+        self._tune_socket(ws)
+        inbox: deque[dict | None] = deque()
+        wakeup = asyncio.Event()
+        reader = asyncio.create_task(self._read_client(ws, inbox, wakeup))
+        try:
+            while True:
+                await wakeup.wait()
+                wakeup.clear()
+                # Take everything that arrived while the previous batch was being sent.
+                batch = list(inbox)
+                inbox.clear()
+                # The reader always queues None last, once the client is gone.
+                closed = bool(batch) and batch[-1] is None
+                if closed:
+                    batch.pop()
+                for data in batch:
+                    await self._handle_message(ws, data)
+                if closed:
+                    return
+        finally:
+            reader.cancel()
+            # Re-raise anything that killed the reader instead of leaving it unretrieved.
+            with suppress(asyncio.CancelledError):
+                await reader
+
+    async def _read_client(self, ws: ServerConnection, inbox: deque[dict | None], wakeup: asyncio.Event) -> None:
         try:
             async for raw in ws:
                 try:
-                    data = json.loads(raw)
+                    data = json_loads(raw)
                 except json.JSONDecodeError:
                     continue
-
+                if not isinstance(data, dict):
+                    continue
+                # A move/scroll that arrives while the previous one is still queued is
+                # folded into it. The pointer hand-off is bounded, so while a slow TV holds
+                # the dispatcher in _send_pointer, moves pile up here and get folded rather
+                # than replayed as a backlog of stale packets.
                 msg_type = data.get("t")
-                if msg_type == "move":
-                    dx = float(data.get("dx", 0))
-                    dy = float(data.get("dy", 0))
-                    await self._send_move(dx, dy)
-                elif msg_type == "scroll":
-                    dx = float(data.get("dx", 0))
-                    dy = float(data.get("dy", 0))
-                    await self._send_scroll(dx, dy)
-                elif msg_type == "click":
-                    await self._send_click()
-                elif msg_type == "double_click":
-                    await self._send_click()
-                    await asyncio.sleep(0.08)
-                    await self._send_click()
-                elif msg_type == "text":
-                    text = data.get("text", "")
-                    if isinstance(text, str) and text:
-                        await self._send_text(text)
-                elif msg_type == "key":
-                    key = data.get("key")
-                    if isinstance(key, str):
-                        await self._send_key(key)
-                elif msg_type == "volume":
-                    action = data.get("action")
-                    if isinstance(action, str):
-                        await self._send_volume(action)
-                elif msg_type == "query_apps":
-                    app_ids = data.get("app_ids")
-                    if isinstance(app_ids, list):
-                        await self._send_app_availability(ws, app_ids)
-                elif msg_type == "list_apps":
-                    await self._send_app_list(ws)
-                elif msg_type == "launch_app":
-                    app_id = data.get("app_id")
-                    if isinstance(app_id, str) and app_id.strip():
-                        if not await self._launch_app(app_id.strip()):
-                            await self._send_app_launch_result(ws, app_id.strip(), ok=False)
+                last = inbox[-1] if inbox else None
+                if msg_type in ("move", "scroll") and last is not None and last.get("t") == msg_type:
+                    try:
+                        folded = {
+                            "t": msg_type,
+                            "dx": float(last.get("dx", 0)) + float(data.get("dx", 0)),
+                            "dy": float(last.get("dy", 0)) + float(data.get("dy", 0)),
+                        }
+                    except (TypeError, ValueError):
+                        logging.warning("Ignoring malformed %s message from %s: %r", msg_type, ws.remote_address, data)
+                        continue
+                    inbox[-1] = folded
                 else:
-                    logging.debug("Unsupported message type from client: %s", msg_type)
+                    inbox.append(data)
+                wakeup.set()
         except ConnectionClosed:
             logging.info("Client disconnected: %s", ws.remote_address)
+        finally:
+            inbox.append(None)
+            wakeup.set()
+
+    async def _handle_message(self, ws: ServerConnection, data: dict) -> None:
+        msg_type = data.get("t")
+        handler = self._dispatch.get(msg_type)
+        if handler is None:
+            logging.debug("Unsupported message type from client: %s", msg_type)
+            return
+        if msg_type != "text":
+            # Anything else (keys in particular) must land after text typed before it.
+            await self._flush_text()
+        await handler(ws, data)
+
+    async def _on_move(self, ws: ServerConnection, data: dict) -> None:
+        await self._send_move(float(data.get("dx", 0)), float(data.get("dy", 0)))
+
+    async def _on_scroll(self, ws: ServerConnection, data: dict) -> None:
+        await self._send_scroll(float(data.get("dx", 0)), float(data.get("dy", 0)))
+
+    async def _on_click(self, ws: ServerConnection, data: dict) -> None:
+        await self._send_click()
+
+    async def _on_double_click(self, ws: ServerConnection, data: dict) -> None:
+        await self._send_click()
+        await asyncio.sleep(0.08)
+        await self._send_click()
+
+    async def _on_text(self, ws: ServerConnection, data: dict) -> None:
+        text = data.get("text", "")
+        if isinstance(text, str) and text:
+            self._queue_text(text)
+
+    async def _on_key(self, ws: ServerConnection, data: dict) -> None:
+        key = data.get("key")
+        if isinstance(key, str):
+            await self._send_key(key)
+
+    async def _on_volume(self, ws: ServerConnection, data: dict) -> None:
+        action = data.get("action")
+        if isinstance(action, str):
+            await self._send_volume(action)
+
+    async def _on_query_apps(self, ws: ServerConnection, data: dict) -> None:
+        app_ids = data.get("app_ids")
+        if isinstance(app_ids, list):
+            await self._send_app_availability(ws, app_ids)
+
+    async def _on_list_apps(self, ws: ServerConnection, data: dict) -> None:
+        await self._send_app_list(ws)
+
+    async def _on_launch_app(self, ws: ServerConnection, data: dict) -> None:
+        app_id = data.get("app_id")
+        if isinstance(app_id, str) and app_id.strip():
+            if not await self._launch_app(app_id.strip()):
+                await self._send_app_launch_result(ws, app_id.strip(), ok=False)
 
     async def _send_app_availability(self, ws: ServerConnection, app_ids: list[object]) -> None:
         try:
@@ -167,62 +345,97 @@ class WebOSPointerBridge:
         except ConnectionClosed:
             pass
 
-    async def _send_pointer(self, payload: str) -> None:
+    async def _send_pointer(self, payload: str | bytes) -> None:
         await self.ensure_pointer()
-        if not self.pointer_ws:
+        queue = self._pointer_queue
+        writer = self._pointer_writer
+        if not self.pointer_ws or queue is None or writer is None:
             raise ConnectionError("Pointer socket not available")
+        data = payload.encode() if isinstance(payload, str) else payload
+        if not queue.full():
+            queue.put_nowait(data)
+            return
+        # The TV is behind: wait for room, but give up if the writer goes away meanwhile.
+        put = asyncio.ensure_future(queue.put(data))
         try:
-            await self.pointer_ws.send(payload)
-        except Exception:
-            logging.exception("Failed to send pointer payload")
-            await self._teardown_pointer()
+            await asyncio.wait((put, writer), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            queued = put.done() and not put.cancelled()
+            if not put.done():
+                put.cancel()
+        if not queued:
+            raise ConnectionError("Pointer socket closed")
+
+    async def _write_pointer(self, pointer_ws: ClientConnection, queue: asyncio.Queue[bytes]) -> None:
+        # Single writer per pointer socket: whatever queued while the previous frame
+        # was in flight goes out together as one frame.
+        while True:
+            parts = [await queue.get()]
+            while not queue.empty():
+                parts.append(queue.get_nowait())
+            try:
+                # webOS expects Text frames; the payloads are already UTF-8.
+                await pointer_ws.send(b"".join(parts), text=True)
+            except Exception:
+                logging.exception("Failed to send pointer payload")
+                if self.pointer_ws is pointer_ws:
+                    await self._teardown_pointer()
+                return
+
+    def _start_pointer_writer(self) -> None:
+        self._pointer_queue = asyncio.Queue(maxsize=POINTER_QUEUE_LIMIT)
+        self._pointer_writer = asyncio.create_task(self._write_pointer(self.pointer_ws, self._pointer_queue))
 
     def _chunk_pointer_delta(self, dx: float, dy: float) -> list[tuple[int, int]]:
         target_dx = int(round(dx))
         target_dy = int(round(dy))
         max_axis = max(abs(target_dx), abs(target_dy))
-        steps = max(1, min(MAX_POINTER_CHUNKS, int(math.ceil(max_axis / MAX_POINTER_DELTA)))) if max_axis else 1
-        if steps == 1:
+        if max_axis <= MAX_POINTER_DELTA:
             return [(target_dx, target_dy)]
+        steps = min(MAX_POINTER_CHUNKS, -(-max_axis // MAX_POINTER_DELTA))
 
         # Spread the total delta across a few smaller packets to keep webOS in its linear range.
+        # Each chunk gets the floor share; the remainders are spread Bresenham-style.
+        base_x, rem_x = divmod(target_dx, steps)
+        base_y, rem_y = divmod(target_dy, steps)
+        err_x = err_y = 0
         chunks: list[tuple[int, int]] = []
-        prev_x = prev_y = 0
-        for i in range(1, steps + 1):
-            next_x = int(round(target_dx * i / steps))
-            next_y = int(round(target_dy * i / steps))
-            chunk_x = next_x - prev_x
-            chunk_y = next_y - prev_y
-            if chunk_x != 0 or chunk_y != 0:
+        for _ in range(steps):
+            chunk_x = base_x
+            chunk_y = base_y
+            err_x += rem_x
+            if err_x >= steps:
+                err_x -= steps
+                chunk_x += 1
+            err_y += rem_y
+            if err_y >= steps:
+                err_y -= steps
+                chunk_y += 1
+            if chunk_x or chunk_y:
                 chunks.append((chunk_x, chunk_y))
-            prev_x, prev_y = next_x, next_y
         return chunks or [(0, 0)]
 
     async def _send_move(self, dx: float, dy: float) -> None:
-        for chunk_dx, chunk_dy in self._chunk_pointer_delta(dx, dy):
-            cmd = f"type:move\ndx:{chunk_dx}\ndy:{chunk_dy}\n\n"
-            await self._send_pointer(cmd)
+        # webOS parses newline-terminated records, so all chunks can share one frame.
+        payload = b"".join(MOVE_TEMPLATE % chunk for chunk in self._chunk_pointer_delta(dx, dy))
+        await self._send_pointer(payload)
 
     async def _send_scroll(self, dx: float, dy: float) -> None:
         # webOS scroll is very sensitive; downscale and accumulate to keep motion smooth.
-        self._scroll_rem_x += dx * SCROLL_SCALE
-        self._scroll_rem_y += dy * SCROLL_SCALE
-
-        scaled_dx = int(round(self._scroll_rem_x))
-        scaled_dy = int(round(self._scroll_rem_y))
-
-        self._scroll_rem_x -= scaled_dx
-        self._scroll_rem_y -= scaled_dy
+        # Round to the nearest whole step and keep the signed remainder for the next event.
+        scaled_dx, rem_x = divmod(self._scroll_rem_x + int(dx * SCROLL_UNITS_PER_PX) + SCROLL_HALF_UNIT, SCROLL_UNIT)
+        scaled_dy, rem_y = divmod(self._scroll_rem_y + int(dy * SCROLL_UNITS_PER_PX) + SCROLL_HALF_UNIT, SCROLL_UNIT)
+        self._scroll_rem_x = rem_x - SCROLL_HALF_UNIT
+        self._scroll_rem_y = rem_y - SCROLL_HALF_UNIT
 
         if scaled_dx == 0 and scaled_dy == 0:
             return
 
-        for chunk_dx, chunk_dy in self._chunk_pointer_delta(scaled_dx, scaled_dy):
-            cmd = f"type:scroll\ndx:{chunk_dx}\ndy:{chunk_dy}\n\n"
-            await self._send_pointer(cmd)
+        payload = b"".join(SCROLL_TEMPLATE % chunk for chunk in self._chunk_pointer_delta(scaled_dx, scaled_dy))
+        await self._send_pointer(payload)
 
     async def _send_click(self) -> None:
-        await self._send_pointer("type:click\n\n")
+        await self._send_pointer(CLICK_PAYLOAD)
 
     async def _send_text(self, text: str) -> None:
         await self.ensure_pointer()
@@ -233,20 +446,68 @@ class WebOSPointerBridge:
         safe = text.replace("\n", "\\n")
         await self._send_pointer(f"type:text\ntext:{safe}\n\n")
 
-    async def _session_request(self, request_id: str, uri: str, payload: dict | None = None) -> dict:
+    def _queue_text(self, text: str) -> None:
+        self._pending_text.append(text)
+        if self._text_flush_handle is None:
+            self._text_flush_handle = asyncio.get_running_loop().call_later(TEXT_BATCH_SECONDS, self._start_text_flush)
+
+    def _start_text_flush(self) -> None:
+        self._text_flush_handle = None
+        self._text_flush_task = asyncio.create_task(self._flush_text())
+
+    async def _flush_text(self) -> None:
+        if self._text_flush_handle is not None:
+            self._text_flush_handle.cancel()
+            self._text_flush_handle = None
+        if not self._pending_text and not self._text_lock.locked():
+            return
+        async with self._text_lock:
+            if not self._pending_text:
+                return
+            text = "".join(self._pending_text)
+            self._pending_text.clear()
+            try:
+                await self._send_text(text)
+            except Exception:
+                logging.exception("Failed to send text to webOS")
+
+    async def _session_request(self, name: str, uri: str, payload: dict | None = None) -> dict:
         if not self.session_ws:
             raise ConnectionError("webOS session not available")
-        async with self._session_request_lock:
-            msg = {"id": request_id, "type": "request", "uri": uri}
-            if payload is not None:
-                msg["payload"] = payload
-            await self.session_ws.send(json.dumps(msg))
-            while True:
-                resp_raw = await asyncio.wait_for(self.session_ws.recv(), timeout=8)
-                resp = json.loads(resp_raw)
-                if resp.get("id") == request_id:
-                    return resp
-                logging.debug("Ignoring unexpected webOS response while waiting for %s: %s", request_id, resp)
+        # Unique ids let the session reader route each response to its waiter, so
+        # requests can be in flight concurrently.
+        request_id = f"{name}_{next(self._request_ids)}"
+        msg = {"id": request_id, "type": "request", "uri": uri}
+        if payload is not None:
+            msg["payload"] = payload
+        future = asyncio.get_running_loop().create_future()
+        self._session_pending[request_id] = future
+        try:
+            await self.session_ws.send(json_dumps(msg), text=True)
+            return await asyncio.wait_for(future, timeout=8)
+        finally:
+            self._session_pending.pop(request_id, None)
+
+    async def _read_session(self, session_ws: ClientConnection) -> None:
+        try:
+            async for raw in session_ws:
+                try:
+                    resp = json_loads(raw)
+                except json.JSONDecodeError:
+                    continue
+                future = self._session_pending.pop(resp.get("id"), None) if isinstance(resp, dict) else None
+                if future is None or future.done():
+                    logging.debug("Ignoring unexpected webOS message: %s", resp)
+                    continue
+                future.set_result(resp)
+        except ConnectionClosed:
+            pass
+        finally:
+            pending = list(self._session_pending.values())
+            self._session_pending.clear()
+            for future in pending:
+                if not future.done():
+                    future.set_exception(ConnectionError("webOS session closed"))
 
     async def _send_text_request(self, text: str) -> bool:
         if not self.session_ws:
@@ -274,7 +535,7 @@ class WebOSPointerBridge:
         if not self.ime_ws:
             return False
         try:
-            await self.ime_ws.send(json.dumps({"type": "insertText", "text": text}))
+            await self.ime_ws.send(json_dumps({"type": "insertText", "text": text}), text=True)
             return True
         except Exception:
             logging.exception("IME send failed; falling back to pointer socket")
@@ -286,41 +547,22 @@ class WebOSPointerBridge:
             for n in name:
                 await self._send_button(n)
             return
-        await self._send_pointer(f"type:button\nname:{name}\n\n")
+        payload = BUTTON_PAYLOADS.get(name) or f"type:button\nname:{name}\n\n".encode()
+        await self._send_pointer(payload)
 
     async def _send_key(self, key: str) -> None:
         if key == "backspace":
             # Try IME delete before falling back to BACKSPACE button.
             if await self._send_ime_delete(1):
                 return
-        key_map = {
-            "enter": "ENTER",
-            "backspace": "BACKSPACE",
-            "escape": "BACK",
-            "back": "BACK",
-            "tab": "TAB",
-            "space": "SPACE",
-            "delete": "BACKSPACE",
-            "arrow_left": "LEFT",
-            "arrow_right": "RIGHT",
-            "arrow_up": "UP",
-            "arrow_down": "DOWN",
-            "home": "HOME",
-            "end": "END",
-            "page_up": "PAGEUP",
-            "page_down": "PAGEDOWN",
-            "power": "POWER",
-            "settings": "MENU",
-        }
-        name = key_map.get(key)
+        name = KEY_MAP.get(key)
         if not name:
             logging.debug("Unsupported key command for webOS: %s", key)
             return
         await self._send_button(name)
 
     async def _send_volume(self, action: str) -> None:
-        vol_map = {"up": "VOLUMEUP", "down": "VOLUMEDOWN", "mute": "MUTE"}
-        name = vol_map.get(action)
+        name = VOL_MAP.get(action)
         if not name:
             logging.debug("Unsupported volume action for webOS: %s", action)
             return
@@ -445,29 +687,75 @@ class WebOSPointerBridge:
             return False
 
     async def ensure_pointer(self) -> None:
+        if self.pointer_ws and not self._is_closed(self.pointer_ws):
+            return
+        # Only the state check and the claim happen under the lock; the handshakes run
+        # outside it and concurrent callers wait for the connector to finish.
         async with self._connect_lock:
             if self.pointer_ws and not self._is_closed(self.pointer_ws):
                 return
+            connecting = self._pointer_connecting
+            if connecting is None:
+                self._pointer_connecting = asyncio.Event()
+        if connecting is not None:
+            await connecting.wait()
+            return
+
+        try:
+            ime_task = self._ime_task
+            if ime_task is not None:
+                # An in-flight IME handshake belongs to the session being replaced.
+                ime_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await ime_task
             await self._teardown_pointer()
             self._ime_failed = False
             await self._connect_pointer()
             await self._connect_ime()
+        finally:
+            connecting, self._pointer_connecting = self._pointer_connecting, None
+            connecting.set()
 
     async def ensure_ime(self) -> None:
+        if (
+            self._pointer_connecting is None
+            and self._ime_connecting is None
+            and (self._ime_failed or (self.ime_ws and not self._is_closed(self.ime_ws)))
+        ):
+            return
+        # Same claim-under-lock pattern as ensure_pointer, so a slow IME handshake never
+        # holds the lock a pointer reconnect needs.
         async with self._connect_lock:
-            if self._ime_failed:
-                return
-            if self.ime_ws and not self._is_closed(self.ime_ws):
-                return
-            await self._connect_ime()
+            # A pointer reconnect also sets up the IME socket.
+            connecting = self._pointer_connecting or self._ime_connecting
+            if connecting is None:
+                if self._ime_failed:
+                    return
+                if self.ime_ws and not self._is_closed(self.ime_ws):
+                    return
+                self._ime_connecting = asyncio.Event()
+        if connecting is not None:
+            await connecting.wait()
+            return
+
+        # Run as a task so a pointer reconnect can abandon it.
+        self._ime_task = asyncio.create_task(self._connect_ime())
+        try:
+            await asyncio.wait([self._ime_task])
+        finally:
+            if not self._ime_task.done():
+                self._ime_task.cancel()
+            self._ime_task = None
+            connecting, self._ime_connecting = self._ime_connecting, None
+            connecting.set()
 
     async def _connect_pointer(self) -> None:
         async def _open_session(use_ssl: bool, port: int):
             uri = f"{'wss' if use_ssl else 'ws'}://{self.tv_host}:{port}"
-            ssl_ctx = ssl._create_unverified_context() if use_ssl else None
+            ssl_ctx = self._ssl_context() if use_ssl else None
             logging.info("Connecting to webOS at %s", uri)
             kwargs = {"ssl": ssl_ctx}
-            origin_header = self._origin_header(send_default=False)
+            origin_header = self._origin_hdr_nondefault
             if origin_header:
                 kwargs["origin"] = origin_header
             return await websockets.connect(uri, **kwargs)
@@ -487,32 +775,33 @@ class WebOSPointerBridge:
             self.session_ws = await _open_session(session_use_ssl, session_port)
 
         await self._register()
+        self._session_reader = asyncio.create_task(self._read_session(self.session_ws))
         socket_path = await self._get_pointer_socket()
         if not socket_path:
             raise ConnectionError("No pointer socket path returned by TV")
 
-        ptr_ssl = ssl._create_unverified_context() if socket_path.startswith("wss://") else None
-        origin_header = self._origin_header()
+        ptr_ssl = self._ssl_context() if socket_path.startswith("wss://") else None
+        origin_header = self._origin_hdr_default
+        # Pointer records are short and uncompressible; skip permessage-deflate.
         if origin_header:
-            self.pointer_ws = await websockets.connect(socket_path, ssl=ptr_ssl, origin=origin_header)
+            self.pointer_ws = await websockets.connect(socket_path, ssl=ptr_ssl, origin=origin_header, compression=None)
         else:
-            self.pointer_ws = await websockets.connect(socket_path, ssl=ptr_ssl)
+            self.pointer_ws = await websockets.connect(socket_path, ssl=ptr_ssl, compression=None)
+        self._tune_socket(self.pointer_ws)
+        self._start_pointer_writer()
         logging.info("Pointer socket established: %s", socket_path)
 
     async def _connect_ime(self) -> None:
         if not self.session_ws:
             return
-        msg = {"id": "ime_0", "type": "request", "uri": IME_URI}
         try:
-            await self.session_ws.send(json.dumps(msg))
-            resp_raw = await self.session_ws.recv()
-            resp = json.loads(resp_raw)
+            resp = await self._session_request("ime", IME_URI)
             socket_path = resp.get("payload", {}).get("socketPath")
             if not socket_path:
                 logging.info("IME socket not provided by TV.")
                 return
-            ssl_ctx = ssl._create_unverified_context() if socket_path.startswith("wss://") else None
-            origin_header = self._origin_header()
+            ssl_ctx = self._ssl_context() if socket_path.startswith("wss://") else None
+            origin_header = self._origin_hdr_default
             if origin_header:
                 self.ime_ws = await websockets.connect(socket_path, ssl=ssl_ctx, origin=origin_header)
             else:
@@ -546,11 +835,11 @@ class WebOSPointerBridge:
             payload["client-key"] = self.client_key
 
         msg = {"id": "register_0", "type": "register", "payload": payload}
-        await self.session_ws.send(json.dumps(msg))
+        await self.session_ws.send(json_dumps(msg), text=True)
 
         while True:
             resp_raw = await self.session_ws.recv()
-            resp = json.loads(resp_raw)
+            resp = json_loads(resp_raw)
             if resp.get("type") == "registered":
                 new_key = resp.get("payload", {}).get("client-key")
                 if new_key and new_key != self.client_key:
@@ -567,13 +856,20 @@ class WebOSPointerBridge:
             raise ConnectionError(f"Register failed: {resp}")
 
     async def _get_pointer_socket(self) -> str:
-        msg = {"id": "pointer_0", "type": "request", "uri": POINTER_URI}
-        await self.session_ws.send(json.dumps(msg))
-        resp_raw = await self.session_ws.recv()
-        resp = json.loads(resp_raw)
+        resp = await self._session_request("pointer", POINTER_URI)
         return resp.get("payload", {}).get("socketPath", "")
 
     async def _teardown_pointer(self) -> None:
+        writer = self._pointer_writer
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
+        self._pointer_writer = None
+        self._pointer_queue = None
+        if self._session_reader:
+            self._session_reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._session_reader
+            self._session_reader = None
         if self.pointer_ws:
             try:
                 await self.pointer_ws.close()
@@ -602,12 +898,25 @@ class WebOSPointerBridge:
                 pass
         self.ime_ws = None
 
+    def _ssl_context(self) -> ssl.SSLContext:
+        # TVs use self-signed certificates; one unverified context is shared by every wss:// connect.
+        if self._ssl_ctx is None:
+            self._ssl_ctx = ssl._create_unverified_context()
+        return self._ssl_ctx
+
+    @staticmethod
+    def _tune_socket(conn: ClientConnection | ServerConnection) -> None:
+        # asyncio already sets TCP_NODELAY; set it explicitly for other event loops.
+        sock = conn.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        with suppress(OSError):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     @staticmethod
     def _is_closed(conn: ClientConnection) -> bool:
-        state = getattr(conn, "state", None)
-        if state is not None:
-            return str(state).lower().endswith("closed")
-        return bool(getattr(conn, "closed", False) or getattr(conn, "closing_exc", None))
+        state = conn.state
+        return state is State.CLOSED or state is State.CLOSING
 
     def _origin_header(self, send_default: bool = True) -> str | None:
         if self.origin == "":
@@ -633,6 +942,13 @@ class WebOSPointerBridge:
             logging.warning("Failed to persist client key.", exc_info=True)
 
 
+def run_event_loop(main_coro: Coroutine[Any, Any, None]) -> None:
+    if uvloop is not None:
+        uvloop.run(main_coro)
+    else:
+        asyncio.run(main_coro)
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser(description="Bridge touchpad events to LG webOS pointer socket.")
     parser.add_argument("--tv-host", required=True, help="IP/DNS of the LG webOS TV")
@@ -669,4 +985,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -8,6 +8,9 @@ the server. Intended for autostart so no console window has to stay open.
 
 import argparse
 import asyncio
+import base64
+import copy
+import io
 import json
 import logging
 import queue
@@ -16,18 +19,24 @@ import threading
 import tkinter as tk
 import urllib.request
 import webbrowser
+from collections import deque
+from contextlib import suppress
+from logging.handlers import QueueHandler as LogRecordQueueHandler
+from logging.handlers import QueueListener
 from pathlib import Path
 from tkinter import scrolledtext
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pystray
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
 from pystray import MenuItem as Item
 
 from ws_touchpad import serve
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 QUEUE_LIMIT = 1000
+LOG_WINDOW_MAX_LINES = 5000
+LOG_POLL_MS = 250
 VERSION_FILE_NAME = "VERSION"
 SERVER_VERSION_ASSET_NAME = "touchpad-server.version.json"
 DEFAULT_APP_VERSION = "unknown"
@@ -36,6 +45,33 @@ LATEST_RELEASE_URL = "https://github.com/michalowskil/lovelace-touchpad-card/rel
 UPDATE_CHECK_INITIAL_DELAY_MS = 10_000
 UPDATE_CHECK_INTERVAL_MS = 24 * 60 * 60 * 1000
 UPDATE_CHECK_TIMEOUT_SECONDS = 10
+# Pre-rendered tray icon (64px) and its LANCZOS downscale for Tk (32px).
+TRAY_ICON_PNG_64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABIUlEQVR42u3bMQ6DMAxAUYg4Rju0nduDwMZBu9GDdG+XHiSdkKJM"
+    "4NiQkO8diJ9sKUpMe7rcfVNxuKbyAAAAAAAAAAAA6o3O4qW/73uyWvD5+hg039dqbYUtk7bEUAGIk2+fr8EqaT/2kyZCEkCYuGXS"
+    "SzCkEK7U5OPvSlvQlZq8FoLT+nguCOYAs3IuyccIa6vAHSH5FAS2wgAcpPylbdDtuVg/9p9g4TdaAAAAAAAAAAAAAAAAAAAAAAAA"
+    "AAAAAPtQOxILj7e2el7jGI0WqB1g1fV4CUfj85X50utyWgCAFTGXVTymUmr5iyogVwRJ8sktkAtCyjpEAKHy3gipg1LiCsgBQWNK"
+    "jDlBJkUN/hqrclaYnSAAAAAAAAAAAFBa/AE5iZmXRJfLtwAAAABJRU5ErkJggg=="
+)
+TRAY_ICON_PNG_32 = (
+    "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAEtElEQVR42u1XS2xVVRRde59zb/s+La+hMeUTlQQ/xRZqQ1HBlhrE"
+    "EEmMoSONMcaoCVGc2AkDTUicKjEMmJhocKBGwSBVwAaV8hGMxQjxE6EBTYR+KH3087737O3gPaCvfa+vNSao8SR7cu+5966z715r"
+    "r02LlzQqbuJi3ORl57KZiACUS1huj+rfCMAYo845CgKXe/8slu9ZVQVEhP4yAGZWEaGhkasUi4YRq45mnBMqh0EVuDQ87PmeRVU4"
+    "rIFzNGcAxrCOjieoKhLWV59/+qfGNfePNbe3jY6PjRoypvhDArBhJBMTfGJPV83Bw0fqunqO19XWxPLApv8XKsYCY4yOTSSoZfk9"
+    "Q1s6t/T1taz0P/757MJTg5fnG8MqqqWToIBv2L2woqGvSdz4H+/siryx64MGcoEyM03FMA3AtZOvWtFw+cCBPUcf6T3T0n3u/CIY"
+    "AzDl8jubQnAOZBg9HRsPB3v3eZs2v7I6GgpNywJPLWAniqpIKPty55Zz6747var73IVFnu8JMynlmUCEsmE9KwCh9aN9a+Nr22lD"
+    "25pLqUxGmak0AMNGr1wdo80dj/X92tLif9n320LPt5JVZQFI8yQsCFUUux6oMhEAMnjq2MmVO3ZuPx3yPXVOMLmKCwA4EcyLhl1j"
+    "65r47l/OLmTD6mb43z6RRj0rpe4LAGZoNp013cl0bHVT40AykwER6TQARIBzjmLRqCxf2zp2sn/gFsntnAbAEikCh5eW3h4ffPTh"
+    "C5VMCtWilUEAMs5xr2jVQ/e1DKYzWRBxaSl2IkhNTHDI2qBcnYWINWSNm40wVRLJeCJhiWjmXkAAiAkzUm1SijFLbdS8sP3jmtH/"
+    "AP4dfsBO4i0AWGYF0XX0llmtKIiowC3MppDtbKo3yAYFLwqICNksRl3AADCeyTKcoEDioAAzDPPcATAxNI++gklfrF8aDxsrLm8u"
+    "DLO6wNH6utokALy27K7hrMh1vyQAqq2Vz/sHIscvX6mciYZ2uplQJBMJrmTjEshaj42+Xn/nSF5wCjMhQiOZrNm27I6RInISTDhH"
+    "xwaHQ8aQWhVNplJmqhDZyS7G9zy9OHzF+/aTT2NPbtp0fseJ3rtT5Kim64slVDxTypQDUrQjK8DGKAzhmZp5A493HXwwUlkBkRsO"
+    "iaee3vc87P/66IJWgzgbUqegtBNKFYlEEPB4NuBUiftOFSJCrQvq+n840F09NBL3rTUFhrUAgIhQdSSkXT3H635/+92qwx0be1Rc"
+    "/rQEyyyWSC2zzBhECiKIE2q/ddGlr5obTnVu3dYsABPK9IIgcFRbE9M33/uwXvZ22d3r276ZHw6lRBVBNuDACQWB49KR2xM2Jlh3"
+    "2+KLh+6t/77jiWdXjiaTtsLzdKojKuoJiQgigmQ6gw1tqy++tXP7mUPJdOxHpYiqg1JxalHerbFz+lxtTX/v/u55nVu3NY0mE36l"
+    "78/elN4YQoBUJoOQ7wcPNC0fal/VPDSRTBpThE7XqGaIkEilzfufHVwyNBKvVFX4vq+l5gMqNxsSkYoIJTMZ5MxE+e5LIERCFbDG"
+    "5NRxhjGpvBKqEhEhGgppVTisgFJ5C6AQUVLVGT8+p9kwn0L6z3XDPwFmDILkRkwK+AAAAABJRU5ErkJggg=="
+)
 
 
 def _resource_dir() -> Path:
@@ -58,6 +94,10 @@ def _read_app_version() -> str:
 APP_VERSION = _read_app_version()
 
 
+def _load_png(data: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(data)))
+
+
 def hide_console_window() -> None:
     """Hide the console window if we were started from cmd.exe."""
     try:
@@ -77,27 +117,36 @@ def get_log_file() -> Path:
 
 
 class QueueHandler(logging.Handler):
-    """Push log records into a bounded queue for the UI."""
+    """Push log records into a bounded ring buffer for the UI."""
 
-    def __init__(self, log_queue: "queue.Queue[str]") -> None:
+    def __init__(self, log_queue: "deque[logging.LogRecord]", notify: Optional[Callable[[], None]] = None) -> None:
         super().__init__()
         self.log_queue = log_queue
+        self.notify = notify
+        self.exc_formatter = logging.Formatter()
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
-            try:
-                self.log_queue.put_nowait(msg)
-            except queue.Full:
-                try:
-                    # Drop the oldest message to make room.
-                    self.log_queue.get_nowait()
-                    self.log_queue.put_nowait(msg)
-                except queue.Empty:
-                    pass
+            # The deque is bounded, so appending drops the oldest record when full.
+            # Records are formatted by the window, and only if someone looks at them.
+            self.log_queue.append(self.prepare(record))
+            if self.notify is not None:
+                self.notify()
         except Exception:
             self.handleError(record)
 
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same idea as logging.handlers.QueueHandler.prepare: merge args and render the
+        # traceback now, so queued records neither pin frames nor see later arg mutations.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
 
 class LogWindow:
     """Simple Tk window that shows log lines; closing or minimizing hides it."""
@@ -105,7 +154,7 @@ class LogWindow:
     def __init__(
         self,
         root: tk.Tk,
-        log_queue: "queue.Queue[str]",
+        log_queue: "deque[logging.LogRecord]",
         log_file: Path,
         icon_photo: Optional[tk.PhotoImage] = None,
     ) -> None:
@@ -113,11 +162,38 @@ class LogWindow:
         self.log_queue = log_queue
         self.log_file = log_file
         self.icon_photo = icon_photo
+        self.formatter = logging.Formatter(LOG_FORMAT)
         self.window: Optional[tk.Toplevel] = None
         self.text: Optional[scrolledtext.ScrolledText] = None
+        self._notify_pending = False
+        self._poll_id: Optional[str] = None
+
+    def notify(self) -> None:
+        """Flag new log lines; safe to call from any thread."""
+        # Never call Tk here: from another thread that blocks (under the logging handler
+        # lock) until the Tk loop services it. The Tk-side poll picks the flag up instead.
+        self._notify_pending = True
+
+    def _start_poll(self) -> None:
+        # Only a shown window polls; a hidden or closed one leaves the tray idle.
+        if self.window is not None and self._poll_id is None:
+            self._poll_id = self.window.after(LOG_POLL_MS, self._poll)
+
+    def _stop_poll(self) -> None:
+        if self.window is not None and self._poll_id is not None:
+            self.window.after_cancel(self._poll_id)
+        self._poll_id = None
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        if self._notify_pending:
+            self._notify_pending = False
+            self._drain_queue()
+        self._start_poll()
 
     def is_visible(self) -> bool:
-        return bool(self.window and self.window.state() == "normal")
+        # Windows reports a maximized Toplevel as "zoomed", so test for hidden states instead.
+        return bool(self.window and self.window.state() not in ("withdrawn", "iconic"))
 
     def show(self) -> None:
         if self.window is None:
@@ -139,13 +215,17 @@ class LogWindow:
             self.window.deiconify()
             self.window.lift()
             self.window.focus_force()
+            self._drain_queue()
+        self._start_poll()
 
     def hide(self) -> None:
         if self.window is not None:
+            self._stop_poll()
             self.window.withdraw()
 
     def destroy(self) -> None:
         if self.window is not None:
+            self._stop_poll()
             self.window.destroy()
             self.window = None
             self.text = None
@@ -163,48 +243,72 @@ class LogWindow:
         self.text.configure(state="disabled")
 
     def _drain_queue(self) -> None:
-        if self.window is None:
+        # While hidden, records stay in the ring unformatted; show() drains them.
+        if not self.log_queue or self.text is None or not self.is_visible():
             return
-        updated = False
-        try:
-            while True:
-                msg = self.log_queue.get_nowait()
-                self._append(msg)
-                updated = True
-        except queue.Empty:
-            pass
-
-        if updated and self.text is not None:
-            self.text.see("end")
-        if self.window is not None:
-            self.window.after(250, self._drain_queue)
+        # Take only what is queued now; lines logged meanwhile set the notify flag and
+        # are picked up by the next poll, so a chatty producer can't pin the Tk thread.
+        popleft = self.log_queue.popleft
+        fmt = self.formatter.format
+        lines = [fmt(popleft()) for _ in range(len(self.log_queue))]
+        # One insert for the whole batch instead of one widget update per line.
+        self.text.configure(state="normal")
+        self.text.insert("end", "\n".join(lines) + "\n")
+        self.text.configure(state="disabled")
+        self._trim()
+        self.text.see("end")
+
+    def _trim(self) -> None:
+        # Keep the Tk text B-tree bounded so inserts don't slow down over a long uptime.
+        if self.text is None:
+            return
+        lines = int(self.text.index("end-1c").split(".")[0])
+        if lines > LOG_WINDOW_MAX_LINES:
+            self.text.configure(state="normal")
+            self.text.delete("1.0", f"end-{LOG_WINDOW_MAX_LINES}l")
+            self.text.configure(state="disabled")
 
 
 class ServerThread(threading.Thread):
-    """Run the async WebSocket server in a background thread."""
+    """Run the async WebSocket server in a background thread.
 
-    def __init__(self, host: str, port: int, scroll_scale: float, stop_event: threading.Event) -> None:
+    Input injection must stay off the Tk thread: SetThreadDesktop refuses to
+    switch a thread that owns windows, which would break the secure desktop.
+    """
+
+    def __init__(self, host: str, port: int, scroll_scale: float) -> None:
         super().__init__(daemon=True)
         self.host = host
         self.port = port
         self.scroll_scale = scroll_scale
-        self.stop_event = stop_event
         self.error: Optional[BaseException] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._stopping = False
 
     def run(self) -> None:
         try:
             logging.info("Starting touchpad server on %s:%s (tray mode)", self.host, self.port)
-            asyncio_run = getattr(asyncio, "run", None)
-            if asyncio_run is None:  # pragma: no cover - Python <3.7 safety
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(serve(self.host, self.port, self.scroll_scale, self.stop_event))
-            else:
-                asyncio_run(serve(self.host, self.port, self.scroll_scale, self.stop_event))
+            asyncio.run(self._serve())
         except Exception as err:  # pragma: no cover - background thread guard
             self.error = err
             logging.exception("Touchpad server stopped with an error")
-            self.stop_event.set()
+
+    def stop(self) -> None:
+        """Cancel the server task; safe to call from any thread."""
+        self._stopping = True
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            with suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(task.cancel)
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        if self._stopping:
+            return
+        with suppress(asyncio.CancelledError):
+            await serve(self.host, self.port, self.scroll_scale)
 
 
 class DaemonIcon(pystray.Icon):
@@ -226,18 +330,19 @@ class TrayApp:
         self.root.title("Touchpad server")
 
         self.stop_event = threading.Event()
-        self.log_queue: "queue.Queue[str]" = queue.Queue(maxsize=QUEUE_LIMIT)
+        self.log_queue: "deque[logging.LogRecord]" = deque(maxlen=QUEUE_LIMIT)
         self.log_file = get_log_file()
-        self.tray_image = self._create_image()
-        self.tk_icon = ImageTk.PhotoImage(self.tray_image.resize((32, 32), Image.LANCZOS))
+        self.tray_image = _load_png(TRAY_ICON_PNG_64)
+        self.tk_icon = ImageTk.PhotoImage(_load_png(TRAY_ICON_PNG_32))
         self.root.iconphoto(True, self.tk_icon)
         self.log_window = LogWindow(self.root, self.log_queue, self.log_file, icon_photo=self.tk_icon)
         self.icon: Optional[pystray.Icon] = None
-        self.server_thread = ServerThread(self.host, self.port, self.scroll_scale, self.stop_event)
+        self.server_thread = ServerThread(self.host, self.port, self.scroll_scale)
         self.update_check_running = False
         self.update_timer: Optional[str] = None
         self.notified_server_version: Optional[str] = None
         self.latest_release_url = LATEST_RELEASE_URL
+        self.log_listener: Optional[QueueListener] = None
 
         self._attach_log_handlers()
 
@@ -254,17 +359,22 @@ class TrayApp:
     def _attach_log_handlers(self) -> None:
         formatter = logging.Formatter(LOG_FORMAT)
 
-        queue_handler = QueueHandler(self.log_queue)
-        queue_handler.setLevel(logging.INFO)
-        queue_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(queue_handler)
+        self.queue_handler = QueueHandler(self.log_queue, notify=self.log_window.notify)
+        self.queue_handler.setLevel(logging.INFO)
+        logging.getLogger().addHandler(self.queue_handler)
 
         try:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
             file_handler.setLevel(logging.INFO)
             file_handler.setFormatter(formatter)
-            logging.getLogger().addHandler(file_handler)
+            # Disk writes happen on the listener thread so a slow flush never stalls the server loop.
+            file_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            file_queue_handler = LogRecordQueueHandler(file_queue)
+            file_queue_handler.setLevel(logging.INFO)
+            self.log_listener = QueueListener(file_queue, file_handler, respect_handler_level=True)
+            self.log_listener.start()
+            logging.getLogger().addHandler(file_queue_handler)
         except Exception:
             logging.exception("Could not set up log file %s", self.log_file)
 
@@ -282,15 +392,6 @@ class TrayApp:
             menu=menu,
         )
 
-    def _create_image(self, size: int = 64) -> Image.Image:
-        image = Image.new("RGBA", (size, size), (28, 33, 45, 255))
-        draw = ImageDraw.Draw(image)
-        draw.rounded_rectangle((10, 10, size - 10, size - 10), radius=14, fill=(0, 173, 181, 255), outline=(255, 255, 255, 180), width=2)
-        draw.line((18, size - 22, size - 18, size - 22), fill=(255, 255, 255, 220), width=3)
-        draw.line((32, 22, 32, size - 22), fill=(255, 255, 255, 220), width=3)
-        draw.line((size - 32, 22, size - 32, size - 22), fill=(255, 255, 255, 220), width=3)
-        return image
-
     def _toggle_logs(self, icon: pystray.Icon, _: Item) -> None:
         self.root.after(0, self._do_toggle_logs)
 
@@ -461,17 +562,25 @@ class TrayApp:
 
     def _stop(self) -> None:
         self.stop_event.set()
+        # Unhook the window before the server's disconnect logging starts.
+        self._detach_log_window()
+        self.server_thread.stop()
         if self.update_timer is not None:
             self.root.after_cancel(self.update_timer)
             self.update_timer = None
-        self.log_window.destroy()
         if self.icon is not None:
             self.icon.visible = False
             self.icon.stop()
         self.root.quit()
 
+    def _detach_log_window(self) -> None:
+        self.queue_handler.notify = None
+        self.log_window.destroy()
+
     def _shutdown(self) -> None:
         self.stop_event.set()
+        self._detach_log_window()
+        self.server_thread.stop()
         if self.server_thread.is_alive():
             self.server_thread.join(timeout=5)
         if self.icon is not None:
@@ -480,8 +589,10 @@ class TrayApp:
                 self.icon.stop()
             except Exception:
                 pass
-        self.log_window.destroy()
         self.root.destroy()
+        if self.log_listener is not None:
+            # Flushes whatever is still queued for the log file.
+            self.log_listener.stop()
         sys.exit(0)
 
 
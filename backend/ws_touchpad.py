@@ -21,13 +21,21 @@ import asyncio
 import json
 import logging
 import threading
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import websockets
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 from websockets.server import ServerConnection
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 try:
     import ctypes
     import ctypes.wintypes as wintypes
@@ -57,6 +65,7 @@ MOUSEEVENTF_RIGHTUP = 0x0010
 MOUSEEVENTF_WHEEL = 0x0800
 MOUSEEVENTF_HWHEEL = 0x01000
 WHEEL_DELTA = 120
+WHEEL_DELTA_INV = 1.0 / WHEEL_DELTA
 KEYEVENTF_KEYUP = 0x0002
 KEYEVENTF_UNICODE = 0x0004
 UOI_NAME = 2
@@ -149,6 +158,8 @@ GetCurrentThreadId.argtypes = []
 GetCurrentThreadId.restype = wintypes.DWORD
 
 _desktop_state = threading.local()
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type.
+json_loads = orjson.loads if orjson is not None else json.loads
 
 
 def _last_error() -> int:
@@ -227,22 +238,71 @@ def _sync_to_input_desktop() -> bool:
     return False
 
 
-def _send_mouse_input(flags: int, dx: int = 0, dy: int = 0, data: int = 0) -> None:
-    _sync_to_input_desktop()
-    mi = MOUSEINPUT(dx, dy, data, flags, 0, 0)
-    inp = INPUT(INPUT_MOUSE, _INPUTUNION(mi))
-    result = SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
-    if result != 1:
-        logging.warning("SendInput failed (%s)", _last_error())
+def _mouse_event(flags: int, dx: int = 0, dy: int = 0, data: int = 0) -> INPUT:
+    return INPUT(INPUT_MOUSE, _INPUTUNION(MOUSEINPUT(dx, dy, data, flags, 0, 0)))
+
+
+def _key_event(vk: int, flags: int = 0, scan: int = 0) -> INPUT:
+    return INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=KEYBDINPUT(vk, scan, flags, 0, 0)))
+
+
+def _input_batch(*events: INPUT) -> ctypes.Array:
+    return (INPUT * len(events))(*events)
+
+
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+# Fixed-flag events never change, so their batches are built once.
+_LEFT_DOWN = _input_batch(_mouse_event(MOUSEEVENTF_LEFTDOWN))
+_LEFT_UP = _input_batch(_mouse_event(MOUSEEVENTF_LEFTUP))
+_LEFT_CLICK = _input_batch(_mouse_event(MOUSEEVENTF_LEFTDOWN), _mouse_event(MOUSEEVENTF_LEFTUP))
+_RIGHT_CLICK = _input_batch(_mouse_event(MOUSEEVENTF_RIGHTDOWN), _mouse_event(MOUSEEVENTF_RIGHTUP))
+_DOUBLE_CLICK = _input_batch(
+    _mouse_event(MOUSEEVENTF_LEFTDOWN),
+    _mouse_event(MOUSEEVENTF_LEFTUP),
+    _mouse_event(MOUSEEVENTF_LEFTDOWN),
+    _mouse_event(MOUSEEVENTF_LEFTUP),
+)
+# Templates whose fields are updated in place before each send.
+_MOVE = _input_batch(_mouse_event(MOUSEEVENTF_MOVE))
+_SCROLL = _input_batch(_mouse_event(MOUSEEVENTF_WHEEL), _mouse_event(MOUSEEVENTF_HWHEEL))
+
+
+def _send_batch(
+    batch: ctypes.Array,
+    label: str,
+    count: Optional[int] = None,
+    _sync: Callable[[], bool] = _sync_to_input_desktop,
+    _send: Callable[..., int] = SendInput,
+    _size: int = _INPUT_SIZE,
+) -> None:
+    # One SendInput call per batch: fewer kernel transitions, and the events are
+    # inserted into the input stream without other input interleaving.
+    # The underscored defaults bind hot globals as locals at definition time.
+    _sync()
+    if count is None:
+        count = len(batch)
+    result = _send(count, batch, _size)
+    if result != count:
+        logging.warning("%s failed (%s)", label, _last_error())
+
+
+def _make_sender(batch: ctypes.Array, label: str = "SendInput") -> Callable[[], None]:
+    # Specialized sender for a batch that never changes: no arguments, no count lookup.
+    count = len(batch)
+    sync = _sync_to_input_desktop
+    send = SendInput
+    size = _INPUT_SIZE
+
+    def sender() -> None:
+        sync()
+        if send(count, batch, size) != count:
+            logging.warning("%s failed (%s)", label, _last_error())
+
+    return sender
 
 
-def _send_keyboard_input(vk: int, flags: int = 0, scan: int = 0) -> None:
-    _sync_to_input_desktop()
-    ki = KEYBDINPUT(vk, scan, flags, 0, 0)
-    inp = INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=ki))
-    result = SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
-    if result != 1:
-        logging.warning("SendInput (keyboard) failed (%s)", _last_error())
+def _send_keyboard_input(*events: INPUT) -> None:
+    _send_batch(_input_batch(*events), "SendInput (keyboard)")
 
 
 class InputInjector:
@@ -251,60 +311,72 @@ class InputInjector:
         self._scroll_rem_x = 0.0
         self._scroll_rem_y = 0.0
 
-    def move(self, dx: float, dy: float) -> None:
-        _send_mouse_input(MOUSEEVENTF_MOVE, int(round(dx)), int(round(dy)))
+    def move(self, dx: float, dy: float, _mi: MOUSEINPUT = _MOVE[0].union.mi) -> None:
+        # _mi is a view into the _MOVE buffer, so writing it updates the batch.
+        # round() with no ndigits already returns an int.
+        _mi.dx = round(dx)
+        _mi.dy = round(dy)
+        _send_batch(_MOVE, "SendInput")
 
     def scroll(self, dx: float, dy: float) -> None:
         # Accumulate pixels into wheel ticks for smoothness
         self._scroll_rem_x += dx * self.scroll_scale
         self._scroll_rem_y += dy * self.scroll_scale
 
-        steps_x = int(self._scroll_rem_x / WHEEL_DELTA)
-        steps_y = int(self._scroll_rem_y / WHEEL_DELTA)
+        steps_x = int(self._scroll_rem_x * WHEEL_DELTA_INV)
+        steps_y = int(self._scroll_rem_y * WHEEL_DELTA_INV)
 
         self._scroll_rem_x -= steps_x * WHEEL_DELTA
         self._scroll_rem_y -= steps_y * WHEEL_DELTA
 
+        count = 0
         if steps_y:
-            _send_mouse_input(MOUSEEVENTF_WHEEL, data=int(steps_y * WHEEL_DELTA))
+            mi = _SCROLL[count].union.mi
+            mi.dwFlags = MOUSEEVENTF_WHEEL
+            mi.mouseData = steps_y * WHEEL_DELTA
+            count += 1
         if steps_x:
-            _send_mouse_input(MOUSEEVENTF_HWHEEL, data=int(steps_x * WHEEL_DELTA))
-
-    def click(self) -> None:
-        _send_mouse_input(MOUSEEVENTF_LEFTDOWN)
-        _send_mouse_input(MOUSEEVENTF_LEFTUP)
-
-    def right_click(self) -> None:
-        _send_mouse_input(MOUSEEVENTF_RIGHTDOWN)
-        _send_mouse_input(MOUSEEVENTF_RIGHTUP)
-
-    def left_down(self) -> None:
-        _send_mouse_input(MOUSEEVENTF_LEFTDOWN)
-
-    def left_up(self) -> None:
-        _send_mouse_input(MOUSEEVENTF_LEFTUP)
-
-    async def double_click(self) -> None:
-        self.click()
-        await asyncio.sleep(0.03)
-        self.click()
+            mi = _SCROLL[count].union.mi
+            mi.dwFlags = MOUSEEVENTF_HWHEEL
+            mi.mouseData = steps_x * WHEEL_DELTA
+            count += 1
+        if count:
+            _send_batch(_SCROLL, "SendInput", count)
+
+    click = staticmethod(_make_sender(_LEFT_CLICK))
+    right_click = staticmethod(_make_sender(_RIGHT_CLICK))
+    left_down = staticmethod(_make_sender(_LEFT_DOWN))
+    left_up = staticmethod(_make_sender(_LEFT_UP))
+    # Both clicks go out in one batch, well within the system double-click time.
+    double_click = staticmethod(_make_sender(_DOUBLE_CLICK))
 
     def type_text(self, text: str) -> None:
-        for ch in text:
-            if ch == "\n":
-                self.press_key("enter")
-                continue
-            codepoint = ord(ch)
-            _send_keyboard_input(0, scan=codepoint, flags=KEYEVENTF_UNICODE)
-            _send_keyboard_input(0, scan=codepoint, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)
+        # KEYEVENTF_UNICODE takes UTF-16 code units, so characters outside the BMP
+        # go out as surrogate pairs.
+        units = array("H", text.encode("utf-16-le"))
+        if not units:
+            return
+        enter_vk = KEY_MAP["enter"]
+        batch = (INPUT * (2 * len(units)))()
+        for i, unit in enumerate(units):
+            down = batch[2 * i]
+            up = batch[2 * i + 1]
+            down.type = up.type = INPUT_KEYBOARD
+            if unit == 0x0A:
+                down.union.ki.wVk = up.union.ki.wVk = enter_vk
+                up.union.ki.dwFlags = KEYEVENTF_KEYUP
+            else:
+                down.union.ki.wScan = up.union.ki.wScan = unit
+                down.union.ki.dwFlags = KEYEVENTF_UNICODE
+                up.union.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+        _send_batch(batch, "SendInput (keyboard)")
 
     def press_key(self, key: str) -> None:
         vk = KEY_MAP.get(key)
         if vk is None:
             logging.warning("Unknown key command: %s", key)
             return
-        _send_keyboard_input(vk)
-        _send_keyboard_input(vk, flags=KEYEVENTF_KEYUP)
+        _send_keyboard_input(_key_event(vk), _key_event(vk, flags=KEYEVENTF_KEYUP))
 
     def adjust_volume(self, action: str) -> None:
         vk_lookup = {
@@ -316,46 +388,106 @@ class InputInjector:
         if vk is None:
             logging.warning("Unknown volume action: %s", action)
             return
-        _send_keyboard_input(vk)
-        _send_keyboard_input(vk, flags=KEYEVENTF_KEYUP)
-
-
-async def handle_client(ws: ServerConnection, injector: InputInjector) -> None:
-    logging.info("Client connected: %s", ws.remote_address)
+        _send_keyboard_input(_key_event(vk), _key_event(vk, flags=KEYEVENTF_KEYUP))
+
+
+MessageHandler = Callable[[Dict[str, Any]], None]
+
+
+def build_handlers(injector: InputInjector) -> Dict[str, MessageHandler]:
+    def on_text(data: Dict[str, Any]) -> None:
+        text = data.get("text", "")
+        if isinstance(text, str) and text:
+            injector.type_text(text)
+
+    def on_key(data: Dict[str, Any]) -> None:
+        key = data.get("key")
+        if isinstance(key, str):
+            injector.press_key(key)
+
+    def on_volume(data: Dict[str, Any]) -> None:
+        action = data.get("action")
+        if isinstance(action, str):
+            injector.adjust_volume(action)
+
+    return {
+        "move": lambda data: injector.move(float(data.get("dx", 0)), float(data.get("dy", 0))),
+        "scroll": lambda data: injector.scroll(float(data.get("dx", 0)), float(data.get("dy", 0))),
+        "click": lambda data: injector.click(),
+        "double_click": lambda data: injector.double_click(),
+        "right_click": lambda data: injector.right_click(),
+        "down": lambda data: injector.left_down(),
+        "up": lambda data: injector.left_up(),
+        "text": on_text,
+        "key": on_key,
+        "volume": on_volume,
+    }
+
+
+async def _read_messages(
+    ws: ServerConnection,
+    inbox: "deque[Optional[Dict[str, Any]]]",
+    wakeup: asyncio.Event,
+) -> None:
     try:
-        async for message in ws:
+        while True:
+            # decode=False hands over the raw UTF-8 payload; both decoders accept bytes.
             try:
-                data: Dict[str, Any] = json.loads(message)
+                message = await ws.recv(decode=False)
+            except ConnectionClosedOK:
+                return
+            try:
+                data = json_loads(message)
             except json.JSONDecodeError:
                 continue
-
+            if not isinstance(data, dict):
+                continue
+            # A move/scroll that arrives while the previous one is still queued is folded
+            # into it. Windows integrates relative deltas anyway, so after a network stall
+            # the cursor catches up in one step instead of replaying stale motion.
             msg_type = data.get("t")
-            if msg_type == "move":
-                injector.move(float(data.get("dx", 0)), float(data.get("dy", 0)))
-            elif msg_type == "scroll":
-                injector.scroll(float(data.get("dx", 0)), float(data.get("dy", 0)))
-            elif msg_type == "click":
-                injector.click()
-            elif msg_type == "double_click":
-                await injector.double_click()
-            elif msg_type == "right_click":
-                injector.right_click()
-            elif msg_type == "down":
-                injector.left_down()
-            elif msg_type == "up":
-                injector.left_up()
-            elif msg_type == "text":
-                text = data.get("text", "")
-                if isinstance(text, str) and text:
-                    injector.type_text(text)
-            elif msg_type == "key":
-                key = data.get("key")
-                if isinstance(key, str):
-                    injector.press_key(key)
-            elif msg_type == "volume":
-                action = data.get("action")
-                if isinstance(action, str):
-                    injector.adjust_volume(action)
+            last = inbox[-1] if inbox else None
+            if msg_type in ("move", "scroll") and last is not None and last.get("t") == msg_type:
+                try:
+                    folded = {
+                        "t": msg_type,
+                        "dx": float(last.get("dx", 0)) + float(data.get("dx", 0)),
+                        "dy": float(last.get("dy", 0)) + float(data.get("dy", 0)),
+                    }
+                except (TypeError, ValueError):
+                    logging.warning("Ignoring malformed %s message from %s: %r", msg_type, ws.remote_address, data)
+                    continue
+                inbox[-1] = folded
+            else:
+                inbox.append(data)
+            wakeup.set()
+    finally:
+        # None marks the end of the stream for the dispatcher.
+        inbox.append(None)
+        wakeup.set()
+
+
+async def handle_client(ws: ServerConnection, handlers: Dict[str, MessageHandler]) -> None:
+    logging.info("Client connected: %s", ws.remote_address)
+    inbox: "deque[Optional[Dict[str, Any]]]" = deque()
+    wakeup = asyncio.Event()
+    reader = asyncio.create_task(_read_messages(ws, inbox, wakeup))
+    try:
+        closed = False
+        while not closed:
+            await wakeup.wait()
+            wakeup.clear()
+            while inbox:
+                data = inbox.popleft()
+                if data is None:
+                    closed = True
+                    break
+                handler = handlers.get(data.get("t"))
+                if handler is not None:
+                    handler(data)
+
+        # Surface the reader's close reason, if any.
+        await reader
     except (ConnectionClosedError, ConnectionClosedOK) as err:
         logging.info(
             "Client closed: %s code=%s reason=%s",
@@ -366,6 +498,7 @@ async def handle_client(ws: ServerConnection, injector: InputInjector) -> None:
     except Exception:
         logging.exception("Client handler error for %s", ws.remote_address)
     finally:
+        reader.cancel()
         logging.info(
             "Client disconnected: %s code=%s reason=%s",
             ws.remote_address,
@@ -374,27 +507,23 @@ async def handle_client(ws: ServerConnection, injector: InputInjector) -> None:
         )
 
 
-async def serve(
-    host: str,
-    port: int,
-    scroll_scale: float,
-    stop_event: Optional[threading.Event] = None,
-) -> None:
-    injector = InputInjector(scroll_scale)
+async def serve(host: str, port: int, scroll_scale: float) -> None:
+    """Serve touchpad clients until the task is cancelled."""
+    # Nothing here runs in the executor today; keep the default pool from growing to cpu+4 idle threads.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=2, thread_name_prefix="touchpad")
+    )
+    handlers = build_handlers(InputInjector(scroll_scale))
     async with websockets.serve(
-        lambda ws: handle_client(ws, injector),
+        lambda ws: handle_client(ws, handlers),
         host,
         port,
-        max_queue=32,
+        max_queue=64,
         ping_interval=15,
         ping_timeout=15,
     ):
         logging.info("Touchpad WebSocket listening on %s:%s", host, port)
-        if stop_event is None:
-            await asyncio.Future()
-        else:
-            while not stop_event.is_set():
-                await asyncio.sleep(0.5)
+        await asyncio.Future()
 
 
 if __name__ == "__main__":